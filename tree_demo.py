@@ -2,14 +2,15 @@
 Módulo de demonstração dos padrões State, Composite, Iterator e Visitor aplicados a uma árvore de decisão.
 """
 
+import sys
+
 from tree_design import (
     TreeBuilder,
-    SplittingState,
+    SPLITTING_STATE,
     DecisionNode,
     LeafNode,
     PreOrderIterator,
-    DepthVisitor,
-    CountLeavesVisitor,
+    MultiVisitor,
 )
 
 
@@ -21,7 +22,7 @@ def main():
     builder = TreeBuilder()
 
     # Define o estado inicial como Splitting (Divisão)
-    builder.set_state(SplittingState())
+    builder.set_state(SPLITTING_STATE)
 
     # Executa o processo de construção, que passará por todos os estados automaticamente
     builder.advance_construction()  # Executa Splitting e transita para Pruning
@@ -76,14 +77,13 @@ def main():
     print("Demonstração do Padrão Visitor:")
     print()
 
-    print("Executando DepthVisitor")
-    depth_visitor = DepthVisitor()
-    root.accept_visitor(depth_visitor)
-    print()
-
-    print("Executando CountLeavesVisitor")
-    count_visitor = CountLeavesVisitor()
-    root.accept_visitor(count_visitor)
+    # Calcula profundidade e total de folhas em uma única travessia
+    print("Executando MultiVisitor")
+    visitor = MultiVisitor(verbose=True)
+    depth, leaves = root.accept_visitor(visitor)
+    sys.stdout.write("\n".join(visitor.buf) + "\n")
+    print(f"Profundidade da árvore: {depth}")
+    print(f"Total de folhas: {leaves}")
 
     print()
     print("#" * 60)
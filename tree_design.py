@@ -3,25 +3,45 @@ Módulo que implementa os padrões Visitor, Composite, Iterator e State para uma
 """
 
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import List, Optional
-
-
-class Node(ABC):
+from array import array
+from collections import deque
+from sys import intern
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+# Tipo do valor agregado pelos visitantes.
+_T = TypeVar("_T")
+
+
+class Node:
     """
-    Classe base abstrata que representa um componente na árvore de decisão (Component).
+    Classe base que representa um componente na árvore de decisão (Component).
     Define a interface comum para nós de decisão e nós folha.
     """
 
-    @abstractmethod
-    def accept_visitor(self, visitor: NodeVisitor) -> None:
+    __slots__ = ()
+
+    def accept_visitor(self, visitor: NodeVisitor) -> Any:
         """
         Aceita um visitante (Visitor) para executar operações sobre o nó.
 
         Args:
             visitor (NodeVisitor): O visitante que processará o nó.
+
+        Returns:
+            Any: O resultado produzido pelo visitante.
         """
-        pass
+        raise NotImplementedError
 
     def __str__(self) -> str:
         """
@@ -35,9 +55,13 @@ class DecisionNode(Node):
     Representa um nó interno de decisão que pode conter filhos (Composite).
     """
 
+    __slots__ = ("children",)
+
     def __init__(self) -> None:
-        """Inicializa um nó de decisão com uma lista vazia de filhos."""
-        self.children: List[Node] = []
+        """Inicializa um nó de decisão sem filhos."""
+        # A lista só é criada ao adicionar o primeiro filho, poupando memória
+        # em nós de decisão que ainda não receberam filhos.
+        self.children: Optional[List[Node]] = None
 
     def add_child_node(self, node: Node) -> None:
         """
@@ -46,16 +70,22 @@ class DecisionNode(Node):
         Args:
             node (Node): O nó (Decisão ou Folha) a ser adicionado.
         """
-        self.children.append(node)
+        if self.children is None:
+            self.children = [node]
+        else:
+            self.children.append(node)
 
-    def accept_visitor(self, visitor: NodeVisitor) -> None:
+    def accept_visitor(self, visitor: NodeVisitor) -> Any:
         """
         Aceita um visitante e delega para o método específico de visitação de nós de decisão.
 
         Args:
             visitor (NodeVisitor): O visitante.
+
+        Returns:
+            Any: O resultado produzido pelo visitante.
         """
-        visitor.visit_decision(self)
+        return visitor.visit_decision(self)
 
 
 class LeafNode(Node):
@@ -64,6 +94,8 @@ class LeafNode(Node):
     Não possui filhos.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         """
         Inicializa o nó folha com um valor de classificação.
@@ -71,99 +103,379 @@ class LeafNode(Node):
         Args:
             value (str): O valor ou rótulo da classe associada a esta folha.
         """
-        self.value: str = value
+        # Rótulos se repetem entre folhas; internar a string faz todas as
+        # folhas com o mesmo rótulo compartilharem um único objeto.
+        # Outros tipos de rótulo (como inteiros) são mantidos como recebidos.
+        self.value: str = intern(value) if type(value) is str else value
 
-    def accept_visitor(self, visitor: NodeVisitor) -> None:
+    def accept_visitor(self, visitor: NodeVisitor) -> Any:
         """
         Aceita um visitante e delega para o método específico de visitação de nós folha.
 
         Args:
             visitor (NodeVisitor): O visitante.
+
+        Returns:
+            Any: O resultado produzido pelo visitante.
         """
-        visitor.visit_leaf(self)
+        return visitor.visit_leaf(self)
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__} -> '{self.value}'"
 
 
+# Tipos de nó usados na representação achatada (FlatTree).
+DECISION_KIND = 0
+LEAF_KIND = 1
+# Índice usado quando não há filho ou irmão.
+NO_NODE = -1
+
+
+class FlatTree:
+    """
+    Representação achatada da árvore em arrays contíguos (estrutura de arrays).
+    Cada nó é identificado por um índice inteiro; os nós são numerados em pós-ordem,
+    de modo que a raiz ocupa o último índice.
+    """
+
+    __slots__ = ("kind", "first_child", "next_sibling", "leaf_values")
+
+    def __init__(self) -> None:
+        """Inicializa uma árvore achatada vazia."""
+        # Tipo de cada nó (DECISION_KIND ou LEAF_KIND).
+        self.kind: array = array("B")
+        # Índice do primeiro filho de cada nó, ou NO_NODE.
+        self.first_child: array = array("i")
+        # Índice do próximo irmão de cada nó, ou NO_NODE.
+        self.next_sibling: array = array("i")
+        # Valor de cada folha; None para nós de decisão.
+        self.leaf_values: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    @property
+    def root(self) -> int:
+        """Índice do nó raiz, ou NO_NODE se a árvore estiver vazia."""
+        return len(self.kind) - 1
+
+
 ##########################################################################################
 
 
-class NodeVisitor(ABC):
+class NodeVisitor:
     """
-    Interface abstrata para os Visitors.
+    Interface para os Visitors.
     Define os métodos de visita para cada tipo concreto de nó (DecisionNode e LeafNode).
     """
 
-    @abstractmethod
-    def visit_decision(self, node: DecisionNode) -> None:
+    __slots__ = ()
+
+    def visit_decision(self, node: DecisionNode) -> Any:
         """
         Método chamado ao visitar um DecisionNode.
 
         Args:
             node (DecisionNode): O nó de decisão sendo visitado.
+
+        Returns:
+            Any: O resultado da operação sobre a subárvore.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def visit_leaf(self, node: LeafNode) -> None:
+    def visit_leaf(self, node: LeafNode) -> Any:
         """
         Método chamado ao visitar um LeafNode.
 
         Args:
             node (LeafNode): O nó folha sendo visitado.
+
+        Returns:
+            Any: O resultado da operação sobre a folha.
+        """
+        raise NotImplementedError
+
+
+def _traverse(
+    root: DecisionNode,
+    leaf_value: _T,
+    combine: Callable[[List[_T]], _T],
+    cache: Dict[Node, _T],
+    on_decision: Optional[Callable[[DecisionNode], None]] = None,
+    on_leaf: Optional[Callable[[LeafNode], None]] = None,
+) -> _T:
+    """
+    Percorre a subárvore usando uma pilha explícita, sem recursão, e agrega
+    os resultados dos filhos em pós-ordem.
+    Evita um frame Python por nível e o limite de recursão em árvores profundas.
+
+    Os resultados dos nós de decisão são memorizados em `cache`, de modo que
+    uma subárvore compartilhada por vários pais é calculada uma única vez.
+    Os visitantes criam um cache novo a cada visita, então modificações na
+    árvore entre visitas são sempre refletidas no resultado.
+
+    Args:
+        root (DecisionNode): O nó de decisão inicial da travessia.
+        leaf_value (_T): O valor atribuído a cada nó folha.
+        combine (Callable[[List[_T]], _T]): Agrega os valores dos filhos de um nó de decisão.
+        cache (Dict[Node, _T]): Resultados já calculados para nós de decisão.
+        on_decision (Optional[Callable[[DecisionNode], None]]): Chamado para cada nó de decisão, em pré-ordem.
+        on_leaf (Optional[Callable[[LeafNode], None]]): Chamado para cada nó folha.
+
+    Returns:
+        _T: O valor agregado da subárvore.
+    """
+    if on_decision is not None:
+        on_decision(root)
+    children = root.children
+    if not children:
+        return combine([])
+
+    # Cada quadro guarda um nó de decisão, um iterador sobre os filhos ainda
+    # não visitados e os valores dos filhos já calculados.
+    values: List[_T] = []
+    frames: List[Tuple[DecisionNode, Iterator[Node], List[_T]]] = [
+        (root, iter(children), values)
+    ]
+    push = frames.append
+    pop = frames.pop
+    while True:
+        for child in frames[-1][1]:
+            if type(child) is DecisionNode:
+                cached = cache.get(child)
+                if cached is not None:
+                    values.append(cached)
+                    continue
+                if on_decision is not None:
+                    on_decision(child)
+                grandchildren = child.children
+                if grandchildren:
+                    # Desce um nível; os irmãos restantes continuam no iterador.
+                    values = []
+                    push((child, iter(grandchildren), values))
+                    break
+                values.append(combine([]))
+            else:
+                if on_leaf is not None:
+                    on_leaf(child)
+                values.append(leaf_value)
+        else:
+            # Todos os filhos do quadro atual foram calculados.
+            node, _, values = pop()
+            value = combine(values)
+            cache[node] = value
+            if not frames:
+                return value
+            values = frames[-1][2]
+            values.append(value)
+
+
+class _AggregatingVisitor(NodeVisitor):
+    """
+    Base dos visitantes que agregam um valor sobre a árvore usando `_traverse`.
+    Cada visita recalcula o resultado a partir da árvore atual; subárvores
+    compartilhadas são calculadas (e rastreadas) uma única vez por visita.
+
+    As subclasses definem o valor das folhas (`_leaf_value`), a agregação dos
+    filhos (`_combine`) e as mensagens de rastreamento.
+    """
+
+    __slots__ = ("verbose", "buf")
+
+    _leaf_value: Any = None
+
+    def __init__(self, verbose: bool = False) -> None:
+        """
+        Args:
+            verbose (bool): Se verdadeiro, registra cada nó visitado em `buf`.
         """
-        pass
+        self.verbose = verbose
+        # Linhas de rastreamento acumuladas, para serem escritas de uma só vez.
+        self.buf: List[str] = []
+
+    def visit_decision(self, node: DecisionNode) -> Any:
+        if self.verbose:
+            on_decision = self._trace_decision
+            on_leaf = self._trace_leaf
+        else:
+            on_decision = on_leaf = None
+        return _traverse(
+            node, self._leaf_value, self._combine, {}, on_decision, on_leaf
+        )
+
+    def visit_leaf(self, node: LeafNode) -> Any:
+        if self.verbose:
+            self._trace_leaf(node)
+        return self._leaf_value
 
+    def _combine(self, values: List[Any]) -> Any:
+        """Agrega os valores dos filhos de um nó de decisão."""
+        raise NotImplementedError
 
-class DepthVisitor(NodeVisitor):
+    def _trace_decision(self, node: DecisionNode) -> None:
+        raise NotImplementedError
+
+    def _trace_leaf(self, node: LeafNode) -> None:
+        raise NotImplementedError
+
+
+def _depth_of(values: List[int]) -> int:
+    """Profundidade de um nó de decisão a partir das profundidades dos filhos."""
+    return 1 + max(values) if values else 0
+
+
+class DepthVisitor(_AggregatingVisitor):
     """
-    Visitor concreto que simula o cálculo da profundidade da árvore.
+    Visitor concreto que calcula a profundidade da árvore (número de arestas
+    no caminho mais longo até uma folha).
     """
 
-    def visit_decision(self, node: DecisionNode) -> None:
-        print(f"DepthVisitor: Calculando profundidade no nó {node}.")
-        for child in node.children:
-            child.accept_visitor(self)
+    __slots__ = ()
+
+    _leaf_value = 0
+    _combine = staticmethod(_depth_of)
 
-    def visit_leaf(self, node: LeafNode) -> None:
-        print(f"DepthVisitor: Atingiu a base da árvore no nó {node}.")
+    def _trace_decision(self, node: DecisionNode) -> None:
+        self.buf.append(f"DepthVisitor: Calculando profundidade no nó {node}.")
+
+    def _trace_leaf(self, node: LeafNode) -> None:
+        self.buf.append(
+            f"DepthVisitor: Atingiu a base da árvore no nó {node}."
+        )
 
 
-class CountLeavesVisitor(NodeVisitor):
+class CountLeavesVisitor(_AggregatingVisitor):
     """
-    Visitor concreto que simula a contagem de nós folha na árvore.
+    Visitor concreto que conta os nós folha da árvore.
     """
 
-    def visit_decision(self, node: DecisionNode) -> None:
-        print(
+    __slots__ = ()
+
+    _leaf_value = 1
+    _combine = staticmethod(sum)
+
+    def _trace_decision(self, node: DecisionNode) -> None:
+        self.buf.append(
             f"CountLeavesVisitor: Atravessando {node} para encontrar folhas."
         )
-        for child in node.children:
-            child.accept_visitor(self)
 
-    def visit_leaf(self, node: LeafNode) -> None:
-        print(f"CountLeavesVisitor: Folha encontrada: {node}.")
+    def _trace_leaf(self, node: LeafNode) -> None:
+        self.buf.append(f"CountLeavesVisitor: Folha encontrada: {node}.")
+
+
+def _depth_and_leaves_of(values: List[Tuple[int, int]]) -> Tuple[int, int]:
+    """Profundidade e total de folhas de um nó de decisão a partir dos filhos."""
+    if not values:
+        return 0, 0
+    depth = 1 + max(child_depth for child_depth, _ in values)
+    leaves = sum(child_leaves for _, child_leaves in values)
+    return depth, leaves
+
+
+class MultiVisitor(_AggregatingVisitor):
+    """
+    Visitor concreto que calcula a profundidade da árvore e conta os nós folha
+    em uma única travessia, em vez de percorrer a árvore uma vez para cada medida.
+    """
+
+    __slots__ = ("depth", "leaves")
+
+    _leaf_value = (0, 1)
+    _combine = staticmethod(_depth_and_leaves_of)
+
+    def __init__(self, verbose: bool = False) -> None:
+        """
+        Args:
+            verbose (bool): Se verdadeiro, registra cada nó visitado em `buf`.
+        """
+        super().__init__(verbose)
+        # Resultados da última visita.
+        self.depth = 0
+        self.leaves = 0
+
+    def visit_decision(self, node: DecisionNode) -> Tuple[int, int]:
+        self.depth, self.leaves = result = super().visit_decision(node)
+        return result
+
+    def visit_leaf(self, node: LeafNode) -> Tuple[int, int]:
+        self.depth, self.leaves = result = super().visit_leaf(node)
+        return result
+
+    def _trace_decision(self, node: DecisionNode) -> None:
+        self.buf.append(f"MultiVisitor: Atravessando {node}.")
+
+    def _trace_leaf(self, node: LeafNode) -> None:
+        self.buf.append(f"MultiVisitor: Folha encontrada: {node}.")
 
 
 ##########################################################################################
 
 
+def pre_order(
+    root: Optional[Node], *, stack: Optional[Deque[Iterator[Node]]] = None
+) -> Iterator[Node]:
+    """
+    Gerador que percorre a árvore em pré-ordem.
+    A pilha fica em uma variável local, evitando buscas de atributo a cada passo,
+    e guarda um cursor por nível da árvore, ocupando O(profundidade) em vez de O(nós).
+
+    Args:
+        root (Optional[Node]): O nó raiz da árvore ou subárvore.
+        stack (Optional[Deque[Iterator[Node]]]): Pilha a ser reaproveitada entre
+            travessias repetidas, evitando uma nova alocação a cada chamada.
+            É esvaziada ao iniciar; não deve ser compartilhada entre travessias simultâneas.
+
+    Yields:
+        Node: Os nós da árvore, na ordem de visita.
+    """
+    if root is None:
+        return
+
+    # Cada entrada é um iterador sobre os filhos ainda não visitados de um nível.
+    if stack is None:
+        stack = deque()
+    else:
+        stack.clear()
+    stack.append(iter((root,)))
+    pop = stack.pop
+    append = stack.append
+    while stack:
+        for node in stack[-1]:
+            yield node
+            # Se for um nó de decisão com filhos, desce um nível antes de
+            # continuar com os irmãos deste nó.
+            if type(node) is DecisionNode:
+                children = node.children
+                if children:
+                    append(iter(children))
+                    break
+        else:
+            # Todos os filhos deste nível foram visitados.
+            pop()
+
+
 class PreOrderIterator:
     """
     Iterador que percorre a árvore seguindo a estratégia Pré-Ordem (Pre-Order).
     Visita a raiz primeiro, depois os filhos recursivamente.
+    A travessia é delegada ao gerador `pre_order`.
     """
 
-    def __init__(self, root: Optional[Node]) -> None:
+    def __init__(
+        self,
+        root: Optional[Node],
+        *,
+        stack: Optional[Deque[Iterator[Node]]] = None,
+    ) -> None:
         """
         Inicializa o iterador com o nó raiz.
 
         Args:
             root (Optional[Node]): O nó raiz da árvore ou subárvore.
+            stack (Optional[Deque[Iterator[Node]]]): Pilha a ser reaproveitada
+                entre travessias repetidas (veja `pre_order`).
         """
-        # A pilha armazena os nós a serem visitados.
-        self.stack: List[Node] = [root] if root else []
+        self._nodes = pre_order(root, stack=stack)
 
     def __iter__(self) -> PreOrderIterator:
         return self
@@ -178,43 +490,105 @@ class PreOrderIterator:
         Raises:
             StopIteration: Quando não há mais nós a visitar.
         """
-        if not self.stack:
-            raise StopIteration
+        return next(self._nodes)
+
+
+def flat_preorder(tree: FlatTree) -> array:
+    """
+    Calcula a ordem de visita em pré-ordem de uma FlatTree.
+    O laço desce diretamente pela cadeia de primeiros filhos e só empilha
+    os irmãos pendentes, trabalhando apenas com aritmética de índices.
+
+    Args:
+        tree (FlatTree): A árvore a ser percorrida.
+
+    Returns:
+        array: Os índices dos nós (array('i')) na ordem em que são visitados.
+    """
+    first_child = tree.first_child
+    next_sibling = tree.next_sibling
+    order = array("i", bytes(first_child.itemsize * len(tree)))
+    if not len(tree):
+        return order
+
+    # A pilha guarda apenas os irmãos que ainda serão visitados.
+    stack: List[int] = []
+    pop = stack.pop
+    push = stack.append
+    visited = 0
+    index = tree.root
+    while True:
+        order[visited] = index
+        visited += 1
+        sibling = next_sibling[index]
+        if sibling != NO_NODE:
+            push(sibling)
+        child = first_child[index]
+        if child != NO_NODE:
+            index = child
+        elif stack:
+            index = pop()
+        else:
+            return order
+
+
+class FlatPreOrderIterator:
+    """
+    Iterador em pré-ordem sobre uma FlatTree.
+    Retorna os índices dos nós, calculados de uma só vez por `flat_preorder`.
+    """
+
+    def __init__(self, tree: FlatTree) -> None:
+        """
+        Inicializa o iterador com a árvore achatada.
+
+        Args:
+            tree (FlatTree): A árvore a ser percorrida.
+        """
+        self._order = iter(flat_preorder(tree))
+
+    def __iter__(self) -> FlatPreOrderIterator:
+        return self
 
-        node = self.stack.pop()
+    def __next__(self) -> int:
+        """
+        Retorna o índice do próximo nó na sequência de iteração.
 
-        # Se for um nó de decisão, adiciona seus filhos à pilha.
-        # Adiciona em ordem reversa para que o primeiro filho seja o próximo a ser pego (LIFO).
-        if isinstance(node, DecisionNode):
-            for child in reversed(node.children):
-                self.stack.append(child)
+        Returns:
+            int: O índice do próximo nó visitado.
 
-        return node
+        Raises:
+            StopIteration: Quando não há mais nós a visitar.
+        """
+        return next(self._order)
 
 
 ##########################################################################################
 
 
-class BuilderState(ABC):
+class BuilderState:
     """
-    Interface abstrata para os estados do processo de construção da árvore.
+    Interface para os estados do processo de construção da árvore.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def execute_construction_phase(self, builder: TreeBuilder) -> None:
         """
-        Executa a lógica específica do estado atual e realiza a transição para o próximo estado.
+        Executa a lógica específica do estado atual.
+        A transição para o próximo estado é feita pelo TreeBuilder, conforme `_TRANSITIONS`.
 
         Args:
             builder (TreeBuilder): O contexto que mantém o estado atual.
         """
-        pass
+        raise NotImplementedError
 
 
 class TreeBuilder:
     """
     Contexto que gerencia o estado atual da construção da árvore.
-    Mantém uma referência para o estado atual e delega a execução para ele.
+    Mantém uma referência para o estado atual, delega a execução para ele e
+    realiza as transições seguindo a tabela `_TRANSITIONS`.
     """
 
     def __init__(self) -> None:
@@ -234,12 +608,108 @@ class TreeBuilder:
 
     def advance_construction(self) -> None:
         """
-        Avança o processo de construção delegando a ação para o estado atual.
+        Avança o processo de construção delegando a ação para o estado atual
+        e transitando para o próximo estado definido em `_TRANSITIONS`.
         """
-        if self._state:
-            self._state.execute_construction_phase(self)
-        else:
+        state = self._state
+        if state is None:
             print("TreeBuilder: Nenhum estado definido para avançar.")
+            return
+
+        state.execute_construction_phase(self)
+        next_state = _TRANSITIONS.get(type(state))
+        if next_state is not None:
+            self.set_state(next_state)
+
+    def relayout_level_order(self, root: Optional[Node]) -> Optional[Node]:
+        """
+        Recria a árvore alocando os nós em ordem de nível (BFS), para que irmãos
+        sejam alocados em sequência e tendam a ficar próximos na memória.
+        A árvore original não é modificada; o chamador deve passar a usar a nova raiz.
+
+        Args:
+            root (Optional[Node]): O nó raiz da árvore.
+
+        Returns:
+            Optional[Node]: A raiz da árvore realocada.
+        """
+        if root is None:
+            return None
+
+        # Coleta todos os nós em ordem de nível.
+        pool: List[Node] = [root]
+        for node in pool:
+            if type(node) is DecisionNode and node.children:
+                pool.extend(node.children)
+
+        # Aloca os novos nós na mesma ordem.
+        relocated: Dict[Node, Node] = {}
+        for node in pool:
+            if node not in relocated:
+                if type(node) is DecisionNode:
+                    relocated[node] = DecisionNode()
+                else:
+                    relocated[node] = LeafNode(node.value)
+
+        # Refaz as listas de filhos apontando para os novos nós.
+        for node, new_node in relocated.items():
+            if type(node) is DecisionNode and node.children:
+                new_node.children = [
+                    relocated[child] for child in node.children
+                ]
+
+        return relocated[root]
+
+    def finalize(self, root: Optional[Node]) -> FlatTree:
+        """
+        Converte a árvore construída para a representação achatada em arrays.
+
+        Args:
+            root (Optional[Node]): O nó raiz da árvore.
+
+        Returns:
+            FlatTree: A árvore com os nós numerados em pós-ordem.
+        """
+        tree = FlatTree()
+        if root is None:
+            return tree
+
+        kind = tree.kind
+        first_child = tree.first_child
+        next_sibling = tree.next_sibling
+        leaf_values = tree.leaf_values
+
+        # Índices dos nós já emitidos cujo pai ainda não foi emitido.
+        emitted: List[int] = []
+        # Cada entrada indica se o nó já teve seus filhos empilhados (pós-ordem).
+        stack: List[Tuple[Node, bool]] = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if type(node) is DecisionNode and node.children and not expanded:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for child in reversed(node.children)
+                )
+                continue
+
+            index = len(kind)
+            if type(node) is DecisionNode:
+                split = len(emitted) - len(node.children or ())
+                children = emitted[split:]
+                del emitted[split:]
+                for current, following in zip(children, children[1:]):
+                    next_sibling[current] = following
+                kind.append(DECISION_KIND)
+                first_child.append(children[0] if children else NO_NODE)
+                leaf_values.append(None)
+            else:
+                kind.append(LEAF_KIND)
+                first_child.append(NO_NODE)
+                leaf_values.append(node.value)
+            next_sibling.append(NO_NODE)
+            emitted.append(index)
+
+        return tree
 
 
 class SplittingState(BuilderState):
@@ -248,12 +718,12 @@ class SplittingState(BuilderState):
     Simula a escolha do melhor atributo para dividir os dados.
     """
 
+    __slots__ = ()
+
     def execute_construction_phase(self, builder: TreeBuilder) -> None:
         print(
             "Estado Splitting: Analisando ganho de informação e dividindo nós."
         )
-        # Lógica simulada de transição para o próximo estado (Poda)
-        builder.set_state(PruningState())
 
 
 class PruningState(BuilderState):
@@ -262,12 +732,12 @@ class PruningState(BuilderState):
     Simula a remoção de ramos irrelevantes para evitar overfitting.
     """
 
+    __slots__ = ()
+
     def execute_construction_phase(self, builder: TreeBuilder) -> None:
         print(
             "Estado Pruning: Avaliando complexidade e podando ramos desnecessários."
         )
-        # Lógica simulada de transição para o próximo estado (Parada)
-        builder.set_state(StoppingState())
 
 
 class StoppingState(BuilderState):
@@ -276,8 +746,22 @@ class StoppingState(BuilderState):
     Indica que a construção da árvore foi concluída.
     """
 
+    __slots__ = ()
+
     def execute_construction_phase(self, builder: TreeBuilder) -> None:
         print(
             "Estado Stopping: Critérios de parada atingidos. Construção finalizada."
         )
-        # Fim do ciclo, não há mais transições automáticas.
+
+
+# Os estados não guardam dados, então uma única instância de cada é compartilhada.
+SPLITTING_STATE = SplittingState()
+PRUNING_STATE = PruningState()
+STOPPING_STATE = StoppingState()
+
+# Tabela de transições: estado atual -> próximo estado.
+# Estados ausentes da tabela (como StoppingState) encerram o ciclo.
+_TRANSITIONS: Dict[Type[BuilderState], BuilderState] = {
+    SplittingState: PRUNING_STATE,
+    PruningState: STOPPING_STATE,
+}